@@ -1,10 +1,14 @@
+import os.path
+import sys
 from abc import ABCMeta
-from collections.abc import KeysView, ValuesView
-from functools import partial
+from collections import deque
+from collections.abc import ItemsView, KeysView, ValuesView
+from functools import lru_cache
 from inspect import ismodule
-from pathlib import Path
+from itertools import islice
+from operator import itemgetter
 from types import MethodType
-from typing import Any, Callable, Generator, Iterable, Type, Union
+from typing import Any, Callable, Iterable, Iterator, Tuple, Type, Union
 
 from .config import RegistryConfig
 from .exceptions import (
@@ -15,18 +19,85 @@ from .exceptions import (
     ModuleAliasError,
     RegistryError,
 )
+from .regex import key_split
+
+# Vanilla methods that may be redirected to their registry counterpart.
+_REDIRECT_METHOD_NAMES = frozenset(
+    {
+        "__getitem__",
+        "__setitem__",
+        "__iter__",
+        "__len__",
+        "__contains__",
+        "keys",
+        "values",
+        "items",
+        "get",
+        "clear",
+    }
+)
+
+# Maximum number of keys shown in a registry's repr.
+_REPR_PREVIEW_SIZE = 8
+
+# Sentinel distinguishing "key absent" from a stored ``None``.
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _parent_folder(file: str) -> str:
+    """Parent directory of ``file``, memoized.
+
+    Safe to cache since a module's ``__file__`` is immutable, and submodules
+    overwhelmingly share the same few parent directories.
+
+    ``os.path.dirname`` is a single C-backed call; a ``pathlib.Path``
+    round-trip would allocate two ``PurePath`` objects per visit.
+    """
+    return os.path.dirname(file)  # noqa: PTH120; hot path, avoids Path allocs
+
+
+def _scan_module(module) -> list:
+    """Sorted, public ``(name, value)`` pairs of a module's namespace.
+
+    ``vars`` reads the module dict directly, skipping ``dir()``'s full
+    attribute protocol and the per-name ``getattr``; sorting preserves
+    ``dir()``'s deterministic ordering. The C-level ``itemgetter`` key
+    sorts on names alone instead of falling through to value comparison.
+    """
+    return sorted(
+        ((x, v) for x, v in vars(module).items() if not x.startswith("_")),
+        key=itemgetter(0),
+    )
 
 
-class _Registry(dict):
-    """Unified container object for __registry__."""
+def _repr_keys(registry: "_Registry") -> str:
+    """Bounded-size preview of a registry's keys for use in ``__repr__``."""
+    data = registry.data
+    preview = list(islice(data, _REPR_PREVIEW_SIZE))
+    n_hidden = len(data) - len(preview)
+    tail = f", ... (+{n_hidden} more)" if n_hidden else ""
+    return f"{preview}{tail}"
+
+
+class _Registry:
+    """Unified container object for __registry__.
+
+    Composes a plain ``data`` dict rather than subclassing ``dict``;
+    ``_DictMixin`` already mediates every public access, and the plain dict
+    keeps stores/lookups on CPython's C fast path.
+    """
+
+    __slots__ = ("data", "config", "name", "_cls", "_parent_registries")
 
     def __init__(self, config: RegistryConfig, name: str = ""):
-        super().__init__()
+        self.data: dict = {}
         self.config = config
         self.name = name
 
         # These will be populated later
         self._cls: Any = None
+        self._parent_registries: Any = None
 
     @property
     def cls(self):
@@ -37,33 +108,44 @@ class _Registry(dict):
         if self._cls is not None:
             self._rereference(self._cls, new_cls)
         self._cls = new_cls
+        self._parent_registries = None
 
     def _rereference(self, old_cls: type, new_cls: type) -> None:
         """Recursively updates all registry references from ``old_cls`` to ``new_cls``."""
         # TODO: this could be optimized by only recursively apply to recursive parents
         # And not searching self at first _rereference iteration.
-        for k, v in self.items():
+        for k, v in self.data.items():
             if v is old_cls:
-                self[k] = new_cls
+                self.data[k] = new_cls
 
         for parent_registry in self.walk_parent_registries():
             parent_registry._rereference(old_cls, new_cls)
 
-    def walk_parent_registries(self) -> Generator["_Registry", None, None]:
-        """Iterates over immediate parenting classes and returns their ``_Registry``."""
-        for parent_cls in self.cls.__bases__:
+    def walk_parent_registries(self) -> Tuple["_Registry", ...]:
+        """Immediate parenting classes' ``_Registry`` objects.
+
+        ``__bases__`` is fixed once ``cls`` is set, so the result is computed
+        once and cached instead of re-probing every base per registration.
+        """
+        parents = self._parent_registries
+        if parents is not None:
+            return parents
+
+        parents = []
+        for parent_cls in self._cls.__bases__:
             if parent_cls is Registry:
                 # Never register to the base Registry class.
                 # Unwanted cross-library interactions may occur, otherwise.
                 continue
 
             try:
-                parent_registry = parent_cls.__registry__
+                parents.append(parent_cls.__registry__)
             except AttributeError:
                 # Not a Registry object
                 continue
 
-            yield parent_registry
+        self._parent_registries = parents = tuple(parents)
+        return parents
 
     def register(
         self,
@@ -88,6 +170,7 @@ class _Registry(dict):
             Set to ``True`` when calling initial ``__register__``.
             Force register to immediate parent(s).
         """
+        config = self.config
         # Derive/Validate Name
         if not name:
             try:
@@ -96,17 +179,18 @@ class _Registry(dict):
                 raise CannotDeriveNameError(
                     f"Cannot derive name from a bare {type(obj)}."
                 ) from e
-            name = self.config.format(name)
+            name = config.format_cached(name)
         elif "." in name or "/" in name:
             raise InvalidNameError(f'Name "{name}" cannot contain "." or "/".')
 
-        # Validate aliases and massage it into a list.
+        # Validate aliases and massage it into a tuple; the common no-alias
+        # case reuses the empty-tuple singleton.
         if aliases is None:
-            aliases = []
+            aliases = ()
         elif isinstance(aliases, str):
-            aliases = [aliases]
+            aliases = (aliases,)
         else:
-            aliases = list(aliases)
+            aliases = tuple(aliases)
 
         # Only use ``aliases_set`` to detect "in", don't iterate since order is not preserved.
         aliases_set = set(aliases)
@@ -115,40 +199,69 @@ class _Registry(dict):
 
         if name not in aliases_set:
             # It may be useful to redundantly define ``name`` in ``aliases``.
-            aliases.insert(0, name)
+            aliases = (name, *aliases)
 
         # Validate aliases
         for alias in aliases:
             if "." in alias or "/" in alias:
                 raise InvalidNameError(f'Alias "{alias}" cannot contain "." or "/".')
-            if not self.config.overwrite and alias in self:
-                raise KeyCollisionError(f'"{alias}" already registered to {self}')
 
-        # Register name and aliases
-        for alias in aliases:
-            # Check if should register self
-            if obj == self.cls:
-                if self.config.register_self:
-                    self[alias] = obj
-            else:
-                self[alias] = obj
+        # Keys are stored in canonical (case-normalized) form and interned,
+        # letting subsequent dict probes short-circuit on pointer equality
+        # (lookup literals are interned by the compiler) and reuse the cached
+        # string hash.
+        aliases = tuple(sys.intern(alias) for alias in aliases)
+
+        self._register_validated(obj, aliases, root=root)
+
+    def _register_validated(
+        self, obj: Any, aliases: Tuple[str, ...], root: bool = False
+    ):
+        """Store ``obj`` under already-validated ``aliases`` and propagate to parents.
+
+        Validation (name derivation, separator and duplicate checks) is performed
+        once in ``register``; propagation re-enters here directly so ancestors
+        don't repeat it.
+        """
+        config = self.config
+        batch = dict.fromkeys(aliases, obj)
+        if not config.overwrite:
+            collisions = batch.keys() & self.data.keys()
+            if collisions:
+                raise KeyCollisionError(
+                    f"{sorted(collisions)} already registered to {self}"
+                )
+
+        # Register name and aliases; ``dict.update`` performs a single C-level
+        # bulk store instead of one ``__setitem__`` per alias. Each alias entry
+        # is just another reference to the same object (one dict slot), so an
+        # alias->canonical-name indirection table would cost the same memory
+        # while adding a probe to every aliased lookup.
+        if obj != self._cls or config.register_self:
+            self.data.update(batch)
 
         # Register to parents if one of the following conditions are met:
         #     1. This is the root ``__recursive__`` call.
         #     2. Both this.recursive is True, and parent.recursive is True.
-        if (root or self.config.recursive) and self.cls is not None:
+        # Propagation recurses over direct parents only (never the full mro),
+        # so ``recursive=False`` hierarchies already pay O(direct parents).
+        if self._cls is not None and (root or config.recursive):
             for parent_registry in self.walk_parent_registries():
                 if root or parent_registry.config.recursive:
-                    parent_registry.register(obj, name=name, aliases=aliases)
+                    parent_registry._register_validated(obj, aliases)
 
 
 class _DictMixin:
     """Dict-like methods for a registry-based class."""
 
+    # ``__registry__`` is stored directly in every registry class's own
+    # ``__dict__`` (see ``RegistryMeta.__new__``), so each access below is a
+    # single type-dict probe; no extra caching indirection is warranted.
     __registry__: _Registry
 
     def __getitem__(self, key: str) -> Type:
-        return self.__registry__.config.getitem(self.__registry__, key)
+        registry = self.__registry__
+        return registry.config.getitem(registry.data, key)
 
     def __setitem__(self, key: str, value: Any):
         if type(self) is RegistryDecorator:
@@ -156,29 +269,68 @@ class _DictMixin:
         else:
             raise RegistryError("Cannot directly setitem on a Registry subclass.")
 
-    def __iter__(self) -> Generator[str, None, None]:
-        yield from self.__registry__
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__registry__.data)
 
     def __len__(self) -> int:
-        return len(self.__registry__)
+        return len(self.__registry__.data)
 
     def __contains__(self, key: str) -> bool:
+        registry = self.__registry__
+        config = registry.config
+        if not isinstance(key, str):
+            try:
+                config.getitem(registry.data, key)
+            except KeyError:
+                return False
+            return True
+
+        # Resolve separator-free keys with plain dict probes; raising and
+        # catching KeyError is comparatively expensive. Probe the raw key
+        # first -- stored keys are already canonical, so a hit skips the
+        # ``lower()`` allocation entirely.
+        if key in registry.data:
+            return True
+        probe = config._normalize(key)
+        if probe is not key and probe in registry.data:
+            return True
+        if "." not in probe and "/" not in probe:
+            return False
+
+        # Dotted key; walk the segments directly rather than re-entering
+        # ``getitem``, which would repeat the probes that just missed.
+        obj: Any = registry.data
         try:
-            self.__registry__.config.getitem(self.__registry__, key)
+            for segment in key_split(probe):
+                obj = obj[segment]
         except KeyError:
             return False
         return True
 
     def keys(self) -> KeysView:
-        return self.__registry__.keys()
+        return self.__registry__.data.keys()
 
     def values(self) -> ValuesView:
-        return self.__registry__.values()
+        return self.__registry__.data.values()
 
-    def items(self):
-        yield from self.__registry__.items()
+    def items(self) -> ItemsView:
+        return self.__registry__.data.items()
 
     def get(self, key: Union[str, Type], default=None) -> Type:
+        registry = self.__registry__
+        if isinstance(key, str):
+            # Same exception-free probing strategy as ``__contains__``.
+            data = registry.data
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            probe = registry.config._normalize(key)
+            if probe is not key:
+                value = data.get(probe, _MISSING)
+                if value is not _MISSING:
+                    return value
+            if "." not in probe and "/" not in probe:
+                return self[default] if isinstance(default, str) else default
         try:
             return self[key]
         except KeyError:
@@ -189,7 +341,7 @@ class _DictMixin:
             return default
 
     def clear(self):
-        self.__registry__.clear()
+        self.__registry__.data.clear()
 
 
 class MethodDescriptor:
@@ -197,20 +349,35 @@ class MethodDescriptor:
     Non-data-descriptor that dispatches depending if it was called from a Class or an instance.
     """
 
+    __slots__ = ("user_method", "registry_method", "_cls_bound_cache")
+
     def __init__(self, user_method, registry_method):
         self.user_method = user_method
         self.registry_method = registry_method
+        # Class-bound methods are immutable; cache them per-class so the hot
+        # ``Registry[...]``-from-class path doesn't allocate on every access.
+        self._cls_bound_cache: dict = {}
 
     def __get__(self, obj, objtype):
         if obj is None:
             # invoked from class
-            return MethodType(self.registry_method, objtype)
+            try:
+                return self._cls_bound_cache[objtype]
+            except KeyError:
+                bound = MethodType(self.registry_method, objtype)
+                self._cls_bound_cache[objtype] = bound
+                return bound
         else:
             # invoked from instance of class
             return MethodType(self.user_method, obj)
 
 
 class RegistryMeta(ABCMeta, _DictMixin):
+    # ``ABCMeta`` is deliberately baked in rather than selected per-class:
+    # dispatching abstract-method-free classes to a lighter ``type``-based
+    # metaclass would give parents and children different metaclasses,
+    # breaking @abstractmethod on plain Registry subclasses and raising
+    # metaclass conflicts on multiple inheritance.
     __registry__: _Registry
 
     def __new__(
@@ -251,37 +418,38 @@ class RegistryMeta(ABCMeta, _DictMixin):
         else:
             for parent_cls in bases:
                 try:
-                    registry_config = parent_cls.__registry__.config.copy()
+                    registry_config = parent_cls.__registry__.config
                     break
                 except AttributeError:
                     pass
             else:
                 # No parent config, create a new one from scratch.
+                # This doubles as the bootstrap path: it only runs for
+                # ``Registry`` itself (and registry-less base classes), so no
+                # separate module-level "is Registry defined yet" sentinel or
+                # try/except is needed.
                 namespace["__registry__"] = _Registry(RegistryConfig(**config))
                 new_cls = super().__new__(cls, cls_name, bases, namespace)
                 return new_cls
 
         # Derive registry name before updating registry config, since a classes own name is
         # subject to it's parents configuration, not its own.
-        registry_name = registry_config.format(cls_name) if name is None else name
+        registry_name = (
+            registry_config.format_cached(cls_name) if name is None else name
+        )
 
-        registry_config.update(config)
+        if config:
+            # Only copy the parent config when it is actually customized; ``update``
+            # is only ever applied to such a copy, so sharing is otherwise safe.
+            registry_config = registry_config.copy()
+            registry_config.update(config)
 
         namespace["__registry__"] = _Registry(registry_config, name=registry_name)
 
-        if namespace["__registry__"].config.redirect:
-            for method_name in [
-                "__getitem__",
-                "__setitem__",
-                "__iter__",
-                "__len__",
-                "__contains__",
-                "keys",
-                "values",
-                "items",
-                "get",
-                "clear",
-            ]:
+        if registry_config.redirect and not _REDIRECT_METHOD_NAMES.isdisjoint(
+            namespace
+        ):
+            for method_name in _REDIRECT_METHOD_NAMES:
                 if method_name in namespace and not isinstance(
                     namespace[method_name], (staticmethod, classmethod)
                 ):
@@ -295,6 +463,10 @@ class RegistryMeta(ABCMeta, _DictMixin):
         new_cls.__registry__.cls = new_cls
 
         if skip:
+            # Registration to parents is the only work skipped. The registry,
+            # its (shared) config, the derived name, and the redirect wrappers
+            # are still needed: a skipped class remains a registry for its own
+            # subclasses and keeps a meaningful ``__registry__.name``.
             return new_cls
 
         # Register to parent(s)
@@ -309,12 +481,17 @@ class RegistryMeta(ABCMeta, _DictMixin):
 
     def __repr__(cls):
         try:
-            return f"<{cls.__name__}: {list(cls.__registry__.keys())}>"
+            return f"<{cls.__name__}: {_repr_keys(cls.__registry__)}>"
         except Exception:
             return super().__repr__()
 
 
 class Registry(metaclass=RegistryMeta):
+    # Empty slots keep the base class itself from forcing a __dict__; user
+    # subclasses may still declare their own attributes (or ``__slots__ = ()``
+    # themselves to stay fully slotted).
+    __slots__ = ()
+
     __call__: Callable
     __contains__: Callable[..., bool]
     __getitem__: Callable[[str], Type]
@@ -353,6 +530,16 @@ class RegistryDecorator(Registry, _DictMixin, skip=True):
         for obj in objs:
             self(obj)
 
+    @classmethod
+    def _from_config(cls, config: RegistryConfig) -> "RegistryDecorator":
+        """Create a ``RegistryDecorator`` around an already-built ``RegistryConfig``.
+
+        Skips the ``asdict``/kwargs round-trip that ``__init__`` would perform.
+        """
+        self = cls.__new__(cls)
+        self.__registry__ = _Registry(config)
+        return self
+
     def __call__(
         self,
         obj: Any = None,
@@ -365,8 +552,14 @@ class RegistryDecorator(Registry, _DictMixin, skip=True):
 
         if obj is None:
             # Was called @my_registry(**config_params)
-            # Maybe copy config and update and pass it through
-            return partial(self.__call__, name=name, aliases=aliases)
+            if not name and aliases is None:
+                # Bare ``@my_registry()``; self is already the decorator.
+                return self
+
+            def decorator(obj):
+                return self.__call__(obj, name=name, aliases=aliases)
+
+            return decorator
 
         if not ismodule(obj):
             self.__registry__.register(obj, name=name, aliases=aliases)
@@ -384,36 +577,51 @@ class RegistryDecorator(Registry, _DictMixin, skip=True):
                 f"Cannot register Python BuiltIn {obj}"
             )
 
-        obj_folder = str(Path(obj_file).parent)
-        # Skip private and magic attributes
-        elem_names = [x for x in dir(obj) if not x.startswith("_")]
-        for elem_name in elem_names:
-            handle = getattr(obj, elem_name)
-            if ismodule(handle):
-                if not config.recursive:
-                    continue
-                try:
-                    handle_file = handle.__file__
-                except AttributeError:
-                    handle_file = None
-
-                if handle_file is None:  # handle is a python built-in
-                    continue
-
-                handle_folder = str(Path(handle_file).parent)
-                if not handle_folder.startswith(obj_folder):
-                    # Only traverse direct submodules
-                    continue
-
-                subregistry = RegistryDecorator(**config.asdict())
-                subregistry(handle)
-                name = subregistry.__registry__.config.format(elem_name)
-                self(subregistry, name=name)
-            else:
-                name = self.__registry__.config.format(elem_name)
-                self(handle, name=name)
+        # Iteratively walk the module tree; recursing per submodule would build a
+        # python frame per nesting level.
+        # ``seen`` guards against package cycles and keeps shared re-exports
+        # (e.g. two submodules both re-exporting ``pkg.utils``) from being
+        # walked twice, while still registering the shared subregistry under
+        # every parent that exports it. Modules stay referenced by their
+        # parents for the duration of the walk, so ``id`` keys are stable.
+        stack = deque([(self, obj)])
+        seen = {id(obj): self}
+        while stack:
+            registry, module = stack.popleft()
+            config = registry.__registry__.config
+            # Loop-invariant per module; don't re-read per attribute.
+            recursive = config.recursive
+            format_name = config.format
+            module_folder = _parent_folder(module.__file__)
+            for elem_name, handle in _scan_module(module):
+                if ismodule(handle):
+                    if not recursive:
+                        continue
+                    try:
+                        handle_file = handle.__file__
+                    except AttributeError:
+                        handle_file = None
+
+                    if handle_file is None:  # handle is a python built-in
+                        continue
+
+                    handle_folder = _parent_folder(handle_file)
+                    if not handle_folder.startswith(module_folder):
+                        # Only traverse direct submodules
+                        continue
+
+                    subregistry = seen.get(id(handle))
+                    if subregistry is None:
+                        # Decorator configs are never mutated after creation, so
+                        # submodule registries can share the parent's config.
+                        subregistry = RegistryDecorator._from_config(config)
+                        seen[id(handle)] = subregistry
+                        stack.append((subregistry, handle))
+                    registry(subregistry, name=format_name(elem_name))
+                else:
+                    registry(handle, name=format_name(elem_name))
 
         return obj
 
     def __repr__(self):
-        return f"<Registry: {list(self.__registry__.keys())}>"
+        return f"<Registry: {_repr_keys(self.__registry__)}>"
@@ -1,12 +1,54 @@
 import dataclasses
 import re
 from dataclasses import asdict, dataclass
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 from .exceptions import InvalidNameError
 from .regex import hyphenate, key_split, to_snake_case
 
 
+def _identity(s: str) -> str:
+    return s
+
+
+def _make_affix_validator(prefix: str, suffix: str) -> Optional[Callable[[str], None]]:
+    """Build a ``prefix``/``suffix`` check specialized for one config.
+
+    The affixes are frozen into closure cells at config-construction time,
+    so each formatted name pays for exactly the checks its config demands
+    rather than re-testing both fields.
+    """
+    if prefix and suffix:
+
+        def validate(name: str) -> None:
+            if not name.startswith(prefix):
+                raise InvalidNameError(f'"{name}" name must start with "{prefix}"')
+            if not name.endswith(suffix):
+                raise InvalidNameError(f'"{name}" name must end with "{suffix}"')
+
+    elif prefix:
+
+        def validate(name: str) -> None:
+            if not name.startswith(prefix):
+                raise InvalidNameError(f'"{name}" name must start with "{prefix}"')
+
+    elif suffix:
+
+        def validate(name: str) -> None:
+            if not name.endswith(suffix):
+                raise InvalidNameError(f'"{name}" name must end with "{suffix}"')
+
+    else:
+        return None
+    return validate
+
+
+# Memoized ``RegistryConfig.format`` results keyed by ``(config-key, raw-name)``.
+# Class names repeat heavily across a registry hierarchy, so hits are common.
+_format_cache: Dict[tuple, str] = {}
+_FORMAT_CACHE_MAX_SIZE = 1024
+
+
 @dataclass
 class RegistryConfig:
     case_sensitive: bool = False
@@ -41,11 +83,41 @@ class RegistryConfig:
     redirect: bool = True
 
     def __post_init__(self):
+        self._compute_derived()
+
+    def _compute_derived(self) -> None:
+        """(Re)build internal state derived from the public configuration."""
         if self.regex:
             self._regex_validator = re.compile(self.regex)
         else:
             self._regex_validator = None
 
+        self._affix_validator = _make_affix_validator(self.prefix, self.suffix)
+
+        # Prefix/suffix stripping reduces to one precomputed slice; the len()
+        # calls are invariant per config, not per formatted name.
+        start = len(self.prefix) if self.strip_prefix and self.prefix else None
+        stop = -len(self.suffix) if self.strip_suffix and self.suffix else None
+        self._strip_slice = slice(start, stop)
+
+        # Case normalization resolved once per config instead of branching on
+        # ``case_sensitive`` at every key operation.
+        self._normalize: Callable[[str], str] = (
+            _identity if self.case_sensitive else str.lower
+        )
+
+        # With no validators or transforms configured, ``format`` degenerates
+        # to bare case normalization; fold that decision here so the hot path
+        # doesn't re-test six config fields per name.
+        self._format_is_trivial = not (
+            self.regex
+            or self.prefix
+            or self.suffix
+            or self.snake_case
+            or self.hyphen
+            or self.transform
+        )
+
     def asdict(self):
         return asdict(self)
 
@@ -55,19 +127,63 @@ class RegistryConfig:
 
     def update(self, new: dict) -> None:
         for key, value in new.items():
-            if hasattr(self, key):
+            if key in _VALID_KEYS:
                 setattr(self, key, value)
             else:
                 raise TypeError(f"Unexpected configuration value {key}={value}")
+        self._compute_derived()
+
+    def _cache_key(self) -> tuple:
+        """Tuple of the fields that influence :meth:`format`'s output.
+
+        Configs with identical formatting rules share ``_format_cache`` entries.
+        """
+        return (
+            self.case_sensitive,
+            self.prefix,
+            self.suffix,
+            self.strip_prefix,
+            self.strip_suffix,
+            self.regex,
+            self.snake_case,
+            self.hyphen,
+            self.transform,
+        )
+
+    def format_cached(self, name: str) -> str:
+        """Memoizing wrapper around :meth:`format`."""
+        key = (self._cache_key(), name)
+        try:
+            return _format_cache[key]
+        except KeyError:
+            pass
+        if len(_format_cache) >= _FORMAT_CACHE_MAX_SIZE:
+            _format_cache.clear()
+        result = _format_cache[key] = self.format(name)
+        return result
 
     def getitem(self, registry: dict, key: str):
         """Key/Value lookup with keysplitting and optional case-insensitivity."""
-        keys = key_split(key)
-        for key in keys:
-            if not self.case_sensitive:
-                key = key.lower()
-
-            registry = registry[key]
+        try:
+            # Overwhelmingly common case: a single, already-canonical key.
+            # Stored keys are lowercase when case-insensitive, so a raw-key hit
+            # is always correct and skips the ``lower()`` allocation.
+            return registry[key]
+        except (KeyError, TypeError):
+            pass
+
+        # Normalizing the whole key up-front is equivalent to normalizing each
+        # segment; "." and "/" are unaffected by case folding.
+        probe = self._normalize(key)
+        if probe is not key:
+            try:
+                return registry[probe]
+            except (KeyError, TypeError):
+                pass
+            key = probe
+
+        for segment in key_split(key):
+            registry = registry[segment]
         return registry
 
     def format(self, name: str) -> str:
@@ -98,20 +214,16 @@ class RegistryConfig:
         str
             New name after applying all transformation and validation rules.
         """
+        if self._format_is_trivial:
+            return self._normalize(name)
+
         if self._regex_validator and not self._regex_validator.match(name):
             raise InvalidNameError(f"{name} name must match regex {self.regex}")
 
-        if not name.startswith(self.prefix):
-            raise InvalidNameError(f'"{name}" name must start with "{self.prefix}"')
-
-        if not name.endswith(self.suffix):
-            raise InvalidNameError(f'"{name}" name must end with "{self.suffix}"')
+        if self._affix_validator is not None:
+            self._affix_validator(name)
 
-        if self.strip_prefix and self.prefix:
-            name = name[len(self.prefix) :]
-
-        if self.strip_suffix and self.suffix:
-            name = name[: -len(self.suffix)]
+        name = name[self._strip_slice]
 
         if self.snake_case:
             name = to_snake_case(name)
@@ -122,7 +234,10 @@ class RegistryConfig:
         if self.transform:
             name = self.transform(name)
 
-        if not self.case_sensitive:
-            name = name.lower()
+        return self._normalize(name)
+
 
-        return name
+# Public dataclass fields accepted by ``RegistryConfig.update``; a single
+# frozenset probe replaces per-key ``hasattr`` descriptor lookups and keeps
+# derived attributes (``_normalize`` et al.) from being settable by name.
+_VALID_KEYS = frozenset(f.name for f in dataclasses.fields(RegistryConfig))
@@ -1,18 +1,26 @@
 """String manipulation functions.
 """
 import re
+from functools import lru_cache
 from typing import List
 
-_to_snake_case_pattern1 = re.compile("(.)([A-Z][a-z]+)")
-_to_snake_case_pattern2 = re.compile("__([A-Z])")
-_to_snake_case_pattern3 = re.compile("([a-z0-9])([A-Z])")
+# Zero-width word boundaries: after a lowercase/digit before an uppercase, or
+# inside an UPPERUpper transition that starts an Upper-lower word.
+_to_snake_case_pattern = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+# Pre-existing double underscore immediately before an uppercase run.
+_collapse_pattern = re.compile(r"__(?=[A-Z](?![a-z]))")
 
 
 def to_snake_case(name: str) -> str:
     """Convert PascalCase to snake_case.
 
-    Based on:
-        https://stackoverflow.com/a/1176023
+    Pure string-to-string conversion over low-cardinality inputs (class and
+    function names recur across registries), so results are memoized.
+
+    Single compiled lookaround pattern inserting all separators in one
+    ``sub`` pass; equivalent to the classic three-regex chain from
+    https://stackoverflow.com/a/1176023, whose double-underscore collapse is
+    preserved by the (rarely taken) ``_collapse_pattern`` pre-pass.
 
     Parameters
     ----------
@@ -22,10 +30,18 @@ def to_snake_case(name: str) -> str:
     -------
     str
     """
-    name = _to_snake_case_pattern1.sub(r"\1_\2", name)
-    name = _to_snake_case_pattern2.sub(r"_\1", name)
-    name = _to_snake_case_pattern3.sub(r"\1_\2", name)
-    return name.lower()
+    if name.islower():
+        # Already snake/lower-cased; the patterns only act around uppercase
+        # letters, so this is an identity call — skip regex and cache alike.
+        return name
+    return _to_snake_case(name)
+
+
+@lru_cache(maxsize=2048)
+def _to_snake_case(name: str) -> str:
+    if "__" in name:
+        name = _collapse_pattern.sub("_", name)
+    return _to_snake_case_pattern.sub("_", name).lower()
 
 
 def hyphenate(name: str) -> str:
@@ -34,4 +50,6 @@ def hyphenate(name: str) -> str:
 
 
 def key_split(s: str) -> List[str]:
-    return s.replace("/", ".").split(".")
+    if "/" in s:
+        s = s.replace("/", ".")
+    return s.split(".")